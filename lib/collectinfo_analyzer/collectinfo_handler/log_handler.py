@@ -11,12 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import atexit
+import collections
+import concurrent.futures
+import io
 import logging
 import ntpath
 import os
 import shutil
-import tarfile
-import zipfile
+import stat
+import threading
+import time
+import types
 
 from lib.utils import common, log_util, util, constants
 from lib.utils.constants import NodeSelection, NodeSelectionType
@@ -36,9 +42,41 @@ SS = 2
 # for zipped files
 COLLECTINFO_DIR = constants.ADMIN_HOME + "collectinfo/"
 COLLECTINFO_INTERNAL_DIR = "collectinfo_analyser_extracted_files"
+EXTRACTION_SENTINEL_FILE = ".extracted"
+
+# ToDo: It should be some proper check for asadm collectinfo json and conf
+# files rather than classification by extension.
+VALID_FILE_EXTENSIONS = frozenset({".json", ".conf"})
+
+# Collectinfo analysis only consumes json/conf (and log/txt sysinfo) files;
+# nested archives are kept so the recursive extraction pass can open them.
+EXTRACTION_WANTED_EXTENSIONS = (
+    ".json",
+    ".conf",
+    ".log",
+    ".txt",
+    ".tar",
+    ".tgz",
+    ".zip",
+    ".gz",
+    ".bz2",
+    ".xz",
+)
 
 ######################
 
+# Background deletions started by close(); joined at interpreter exit so
+# pending removals finish before the process goes away.
+_pending_cleanup_threads = []
+
+
+def _wait_for_pending_cleanups():
+    for thread in _pending_cleanup_threads:
+        thread.join()
+
+
+atexit.register(_wait_for_pending_cleanups)
+
 
 class LogHandlerException(Exception):
     pass
@@ -49,12 +87,15 @@ class CollectinfoLogHandler(object):
     Handles interaction with the ascinfo.json file to make it act more like live_cluster/cluster.
     """
 
-    all_cinfo_logs = {}
-    selected_cinfo_logs = {}
-
     def __init__(self, cinfo_path):
+        self.all_cinfo_logs = {}
+        self.selected_cinfo_logs = {}
         self.cinfo_path = cinfo_path
         self.collectinfo_dir = COLLECTINFO_DIR + str(os.getpid())
+        self._dir_listing_cache = {}
+        self._archive_kind_cache = {}
+        self._meta_data_cache = {}
+        self._sorted_timestamps = None
         self._validate_and_extract_compressed_files(
             cinfo_path, dest_dir=self.collectinfo_dir
         )
@@ -73,7 +114,7 @@ class CollectinfoLogHandler(object):
             return status_str
 
         i = 1
-        for timestamp in sorted(self.all_cinfo_logs.keys()):
+        for timestamp in self._get_sorted_timestamps():
             nodes = list(self.all_cinfo_logs[timestamp].get_node_names().keys())
             if len(nodes) == 0:
                 continue
@@ -97,11 +138,33 @@ class CollectinfoLogHandler(object):
                     self.all_cinfo_logs[timestamp].destroy()
                 except Exception:
                     pass
-            self.all_cinfo_logs.clear()
-            self.selected_cinfo_logs.clear()
+            # Drop the references instead of clearing dicts that are shared
+            # with CollectinfoLog.snapshots, so the snapshot graph can be
+            # collected promptly.
+            self.all_cinfo_logs = {}
+            self.selected_cinfo_logs = {}
+
+        self._meta_data_cache.clear()
+        self._sorted_timestamps = None
 
-        if os.path.exists(self.collectinfo_dir):
-            shutil.rmtree(self.collectinfo_dir)
+        if self._safe_stat(self.collectinfo_dir) is None:
+            return
+
+        # Renaming the extracted tree aside is a single directory-entry
+        # update; the (potentially huge) unlink pass runs in the background
+        # so close() returns to the CLI immediately.
+        trash_dir = "%s.trash-%d" % (self.collectinfo_dir, time.monotonic_ns())
+        try:
+            os.replace(self.collectinfo_dir, trash_dir)
+        except OSError:
+            shutil.rmtree(self.collectinfo_dir, ignore_errors=True)
+            return
+
+        thread = threading.Thread(
+            target=shutil.rmtree, args=(trash_dir,), kwargs={"ignore_errors": True}
+        )
+        thread.start()
+        _pending_cleanup_threads.append(thread)
 
     def get_cinfo_log_at(self, timestamp=""):
         if not timestamp or timestamp not in self.all_cinfo_logs:
@@ -185,32 +248,38 @@ class CollectinfoLogHandler(object):
 
         version = self.info_meta_data(stanza="asd_build")
 
+        # Bind the hot callables once; this loop runs for every
+        # timestamp x node x namespace in the bundle.
+        parse_raw_histogram = common.parse_raw_histogram
+        is_new_histogram_version = common.is_new_histogram_version
+
         for timestamp, hist_snapshot in hist_dict.items():
             res_dict[timestamp] = {}
             if not hist_snapshot:
                 continue
 
+            versions_ts = version.get(timestamp) or {}
+
             for node, node_snapshot in hist_snapshot.items():
-                res_dict[timestamp][node] = {}
+                node_dict = res_dict[timestamp][node] = {}
                 if not node_snapshot:
                     continue
 
+                as_version = versions_ts.get(node)
+
                 for namespace, namespace_snapshot in node_snapshot.items():
                     if not namespace_snapshot:
                         continue
 
                     try:
-                        as_version = version[timestamp][node]
-                        d = common.parse_raw_histogram(
+                        d = parse_raw_histogram(
                             stanza,
                             namespace_snapshot,
                             logarithmic=byte_distribution,
-                            new_histogram_version=common.is_new_histogram_version(
-                                as_version
-                            ),
+                            new_histogram_version=is_new_histogram_version(as_version),
                         )
                         if d and not isinstance(d, Exception):
-                            res_dict[timestamp][node][namespace] = d
+                            node_dict[namespace] = d
 
                     except Exception:
                         pass
@@ -220,7 +289,19 @@ class CollectinfoLogHandler(object):
         return self._fetch_from_cinfo_log(type="latency")
 
     def info_meta_data(self, stanza=""):
-        return self._fetch_from_cinfo_log(type="meta_data", stanza=stanza)
+        # Metadata never changes for loaded snapshots but is re-fetched by
+        # every info_histogram call (for asd_build) and the various
+        # node-id/ip mapping helpers; memoize per stanza. The cached dict is
+        # shared between callers, so hand out a read-only view instead of a
+        # defensive copy.
+        try:
+            return self._meta_data_cache[stanza]
+        except KeyError:
+            data = types.MappingProxyType(
+                self._fetch_from_cinfo_log(type="meta_data", stanza=stanza)
+            )
+            self._meta_data_cache[stanza] = data
+            return data
 
     def info_pmap(self):
         return self._fetch_from_cinfo_log(type="pmap")
@@ -254,7 +335,7 @@ class CollectinfoLogHandler(object):
         if not stanza:
             return res_dict
 
-        for timestamp in sorted(self.selected_cinfo_logs.keys()):
+        for timestamp in self._get_sorted_timestamps():
             try:
                 out = self.selected_cinfo_logs[timestamp].get_sys_data(stanza=stanza)
                 res_dict[timestamp] = util.restructure_sys_data(out, stanza)
@@ -263,48 +344,62 @@ class CollectinfoLogHandler(object):
 
         return res_dict
 
+    def _list_all_files(self, dir_path):
+        # Directory walks are repeated over the same paths during init;
+        # memoize them. The cache is cleared whenever extraction adds files.
+        try:
+            files = self._dir_listing_cache[dir_path]
+        except KeyError:
+            files = [
+                file
+                for file in log_util.get_all_files(dir_path)
+                if os.path.basename(file) != EXTRACTION_SENTINEL_FILE
+            ]
+            self._dir_listing_cache[dir_path] = files
+
+        return files
+
+    def _get_sorted_timestamps(self):
+        # Snapshots are populated once in _add_cinfo_log_files; avoid
+        # re-sorting the keys on every stanza fetch.
+        if self._sorted_timestamps is None:
+            self._sorted_timestamps = tuple(sorted(self.selected_cinfo_logs.keys()))
+
+        return self._sorted_timestamps
+
     def _get_valid_files(self, cinfo_path=""):
         try:
             if not cinfo_path:
                 cinfo_path = self.cinfo_path
 
-            log_files = log_util.get_all_files(cinfo_path)
-            valid_files = []
-            for log_file in log_files:
-                try:
-                    # ToDo: It should be some proper check for asadm
-                    # collectinfo json file.
-                    if os.path.splitext(log_file)[1] == ".json":
-                        valid_files.append(log_file)
-                        continue
-                except Exception:
-                    pass
-
-                try:
-                    # ToDo: It should be some proper check for asadm
-                    # conf file.
-                    if os.path.splitext(log_file)[1] == ".conf":
-                        valid_files.append(log_file)
-                except Exception:
-                    pass
+            log_files = self._list_all_files(cinfo_path)
+            splitext = os.path.splitext
 
-            return valid_files
+            return [
+                log_file
+                for log_file in log_files
+                if splitext(log_file)[1] in VALID_FILE_EXTENSIONS
+            ]
 
-        except Exception:
+        except OSError:
             return []
 
     def _get_all_file_paths(self, cinfo_path):
         files = []
+        cinfo_stat = self._safe_stat(cinfo_path)
+
+        if cinfo_stat is None:
+            return files
 
-        if os.path.isfile(cinfo_path):
+        if stat.S_ISREG(cinfo_stat.st_mode):
             if not self._is_compressed_file(cinfo_path):
                 files.append(cinfo_path)
             else:
-                files += log_util.get_all_files(self.collectinfo_dir)
+                files += self._list_all_files(self.collectinfo_dir)
 
-        elif os.path.isdir(cinfo_path):
-            files += log_util.get_all_files(cinfo_path)
-            if os.path.exists(self.collectinfo_dir):
+        elif stat.S_ISDIR(cinfo_stat.st_mode):
+            files += self._list_all_files(cinfo_path)
+            if self._safe_stat(self.collectinfo_dir) is not None:
                 # ToDo: Before adding file from collectinfo_dir, we need to check file already exists in input file list or not,
                 # ToDo: collectinfo_parser fails if same file exists twice in input file list. This is possible if input has zip file and
                 # ToDo: user unzipped it but did not remove zipped file, in that case collectinfo-analyser creates new unzipped file,
@@ -312,7 +407,19 @@ class CollectinfoLogHandler(object):
 
                 files += self._get_valid_files(self.collectinfo_dir)
 
-        return files
+        # Duplicate paths (e.g. an archive the user already unzipped next to
+        # the original) crash the collectinfo parser; dedupe by realpath.
+        seen = set()
+        unique_files = []
+        for file in files:
+            real_path = os.path.realpath(file)
+            if real_path in seen:
+                continue
+
+            seen.add(real_path)
+            unique_files.append(file)
+
+        return unique_files
 
     def _add_cinfo_log_files(self, cinfo_path=""):
         if not cinfo_path:
@@ -328,6 +435,7 @@ class CollectinfoLogHandler(object):
         cinfo_log = CollectinfoLog(cinfo_path, files)
         self.selected_cinfo_logs = cinfo_log.snapshots
         self.all_cinfo_logs = cinfo_log.snapshots
+        self._sorted_timestamps = tuple(sorted(cinfo_log.snapshots.keys()))
         self.license_data_usage = cinfo_log.license_data_usage
         snapshots_added = len(self.all_cinfo_logs)
         if not snapshots_added:
@@ -345,13 +453,17 @@ class CollectinfoLogHandler(object):
         if not type:
             return res_dict
 
-        for timestamp in sorted(self.selected_cinfo_logs.keys()):
+        # Hoist the flip branch and the log-map lookup out of the loop.
+        selected_cinfo_logs = self.selected_cinfo_logs
+        flip_keys = util.flip_keys if flip else None
+
+        for timestamp in self._get_sorted_timestamps():
             try:
-                out = self.selected_cinfo_logs[timestamp].get_data(
+                out = selected_cinfo_logs[timestamp].get_data(
                     type=type, stanza=stanza, nodes=nodes
                 )
-                if flip:
-                    out = util.flip_keys(out)
+                if flip_keys is not None:
+                    out = flip_keys(out)
 
                 res_dict[timestamp] = out
 
@@ -360,76 +472,277 @@ class CollectinfoLogHandler(object):
 
         return res_dict
 
+    @staticmethod
+    def _safe_stat(path):
+        # One stat syscall instead of the exists-then-open pattern, which
+        # is both racy and twice the syscalls on hot classification paths.
+        if not path:
+            return None
+
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _classify_archive(file):
+        # tarfile is imported lazily; it (and zipfile) only matter when a
+        # compressed input actually shows up, and both are costly at startup.
+        import tarfile
+
+        try:
+            with open(file, "rb") as f:
+                header = f.read(512)
+        except OSError:
+            return None
+
+        if header.startswith(b"PK\x03\x04"):
+            return "zip"
+
+        if len(header) >= 262 and header[257:262] == b"ustar":
+            return "tar"
+
+        if header.startswith(b"\x1f\x8b"):
+            compression = "gz"
+        elif header.startswith(b"BZh"):
+            compression = "bz2"
+        elif header.startswith(b"\xfd7zXZ\x00"):
+            compression = "xz"
+        else:
+            return None
+
+        # A gz/bz2/xz stream is only extractable here if it wraps a tar.
+        try:
+            if tarfile.is_tarfile(file):
+                return "tar:" + compression
+        except (OSError, EOFError, tarfile.TarError):
+            pass
+
+        return None
+
+    def _sniff_archive(self, file):
+        # _is_compressed_file and _extract_to both probe the same paths;
+        # classify by magic bytes once and remember the result.
+        try:
+            kind = self._archive_kind_cache[file]
+        except KeyError:
+            kind = self._classify_archive(file)
+            self._archive_kind_cache[file] = kind
+
+        return kind
+
     def _is_compressed_file(self, file):
-        if not file or not os.path.exists(file):
+        # No separate existence check; the sniff's open() reports missing
+        # files as unclassifiable.
+        if not file:
             return False
 
-        if zipfile.is_zipfile(file) or tarfile.is_tarfile(file):
-            return True
+        return self._sniff_archive(file) is not None
+
+    @staticmethod
+    def _wanted_member(name):
+        return name.lower().endswith(EXTRACTION_WANTED_EXTENSIONS)
+
+    def _extract_member(self, tar, member, dest_dir):
+        if member.isdir():
+            os.makedirs(os.path.join(dest_dir, member.name), exist_ok=True)
+            return
+
+        if not member.isfile():
+            tar.extract(member, path=dest_dir)
+            return
+
+        dest_path = os.path.join(dest_dir, member.name)
+        dest_parent = os.path.dirname(dest_path)
+        if dest_parent:
+            os.makedirs(dest_parent, exist_ok=True)
 
-        return False
+        src = tar.extractfile(member)
+        if src is None:
+            return
+
+        with src, open(dest_path, "wb", buffering=1 << 20) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+    def _extract_zip_member(self, zip_file, zip_info, dest_dir):
+        name = zip_info.filename
+        if os.path.isabs(name) or ".." in name.split("/"):
+            return
+
+        dest_path = os.path.join(dest_dir, name)
+        dest_parent = os.path.dirname(dest_path)
+        if dest_parent:
+            os.makedirs(dest_parent, exist_ok=True)
+
+        # ZipFile.extract writes in small chunks; copy with 1MiB blocks to
+        # cut write syscalls on bundles of many per-node logs.
+        with zip_file.open(zip_info) as src, open(
+            dest_path, "wb", buffering=1 << 20
+        ) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+        try:
+            mtime = time.mktime(zip_info.date_time + (0, 0, -1))
+            os.utime(dest_path, (mtime, mtime))
+        except (OverflowError, ValueError, OSError):
+            pass
 
     def _extract_to(self, file, dest_dir):
-        if not file or not os.path.exists(file):
+        import tarfile
+        import zipfile
+
+        if not file:
             return False
 
-        try:
-            if tarfile.is_tarfile(file):
-                compressed_file = tarfile.open(file)
+        kind = self._sniff_archive(file)
+        if kind is None:
+            return False
 
-            elif zipfile.is_zipfile(file):
+        raw_file = None
+        try:
+            if kind == "zip":
                 compressed_file = zipfile.ZipFile(file, "r")
 
             else:
-                return False
-
-        except Exception:
+                # Large read buffer and per-member streaming copies keep
+                # syscall counts low on tarballs full of small log files.
+                # The sniffed kind lets tarfile skip compression autodetect.
+                mode = "r:" if kind == "tar" else "r:" + kind.partition(":")[2]
+                raw_file = io.open(file, "rb", buffering=2 * 1024 * 1024)
+                compressed_file = tarfile.open(fileobj=raw_file, mode=mode)
+
+        except (OSError, zipfile.BadZipFile, tarfile.TarError):
+            if raw_file is not None:
+                raw_file.close()
             return False
 
         file_extracted = False
         try:
-            compressed_file.extractall(path=dest_dir)
+            if isinstance(compressed_file, tarfile.TarFile):
+                member = compressed_file.next()
+                while member is not None:
+                    if member.isfile() and self._wanted_member(member.name):
+                        self._extract_member(compressed_file, member, dest_dir)
+                    # TarFile caches every seen TarInfo in self.members;
+                    # drop them so memory stays O(1) for huge bundles.
+                    compressed_file.members = []
+                    member = compressed_file.next()
+            else:
+                for zip_info in compressed_file.infolist():
+                    if not zip_info.is_dir() and self._wanted_member(
+                        zip_info.filename
+                    ):
+                        self._extract_zip_member(compressed_file, zip_info, dest_dir)
             file_extracted = True
-        except Exception:
+        except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError):
             file_extracted = False
         finally:
             compressed_file.close()
+            if raw_file is not None:
+                raw_file.close()
 
         return file_extracted
 
-    def _validate_and_extract_compressed_files(self, cinfo_path, dest_dir=None):
-        if not cinfo_path or not os.path.exists(cinfo_path):
+    @classmethod
+    def _extraction_token(cls, file, st=None):
+        if st is None:
+            st = cls._safe_stat(file)
+            if st is None:
+                return None
+
+        return "%s:%d:%d" % (os.path.abspath(file), st.st_size, int(st.st_mtime))
+
+    @staticmethod
+    def _read_extraction_sentinel(dest_dir):
+        try:
+            with open(os.path.join(dest_dir, EXTRACTION_SENTINEL_FILE)) as f:
+                return set(line.strip() for line in f if line.strip())
+        except OSError:
+            return set()
+
+    @staticmethod
+    def _record_extraction(dest_dir, tokens):
+        if not tokens:
             return
 
+        try:
+            with open(os.path.join(dest_dir, EXTRACTION_SENTINEL_FILE), "a") as f:
+                for token in tokens:
+                    f.write(token + "\n")
+        except OSError:
+            pass
+
+    def _validate_and_extract_compressed_files(self, cinfo_path, dest_dir=None):
         if not dest_dir:
             dest_dir = self.collectinfo_dir
 
-        if not os.path.exists(dest_dir):
-            os.makedirs(dest_dir)
-
-        if os.path.isfile(cinfo_path):
-            if not self._is_compressed_file(cinfo_path):
-                return
+        # Nested archives are handled with a BFS work queue instead of
+        # recursion; visited realpaths guard against re-walking a level.
+        queue = collections.deque([(cinfo_path, dest_dir)])
+        visited = set()
 
-            if self._extract_to(cinfo_path, dest_dir):
-                self._validate_and_extract_compressed_files(
-                    dest_dir, dest_dir=os.path.join(dest_dir, COLLECTINFO_INTERNAL_DIR)
-                )
-                return
+        while queue:
+            source, dest = queue.popleft()
 
-        files = log_util.get_all_files(cinfo_path)
-        if not files:
-            return
+            source_stat = self._safe_stat(source)
+            if source_stat is None:
+                continue
 
-        file_extracted = False
-        for file in files:
-            if not self._is_compressed_file(file):
+            real_source = os.path.realpath(source)
+            if real_source in visited:
                 continue
+            visited.add(real_source)
 
-            if self._extract_to(file, dest_dir):
-                file_extracted = True
+            os.makedirs(dest, exist_ok=True)
 
-        if file_extracted:
-            self._validate_and_extract_compressed_files(
-                dest_dir, dest_dir=os.path.join(dest_dir, COLLECTINFO_INTERNAL_DIR)
-            )
+            # Archives already extracted into dest on an earlier pass are
+            # recorded in a sentinel file keyed by source path, size and
+            # mtime; skip re-decompressing them on warm re-runs.
+            already_extracted = self._read_extraction_sentinel(dest)
+
+            if stat.S_ISREG(source_stat.st_mode):
+                candidates = [source] if self._is_compressed_file(source) else []
+            else:
+                candidates = [
+                    file
+                    for file in self._list_all_files(source)
+                    if self._is_compressed_file(file)
+                ]
+
+            compressed_files = [
+                file
+                for file in candidates
+                if self._extraction_token(file) not in already_extracted
+            ]
+            if not compressed_files:
+                continue
+
+            if len(compressed_files) == 1:
+                results = [self._extract_to(compressed_files[0], dest)]
+            else:
+                # Sibling archives (per-node .tgz/.zip subarchives) are
+                # independent; decompression releases the GIL, so extract
+                # them concurrently.
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 4)
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            lambda file: self._extract_to(file, dest),
+                            compressed_files,
+                        )
+                    )
+
+            if any(results):
+                self._record_extraction(
+                    dest,
+                    [
+                        token
+                        for file, extracted in zip(compressed_files, results)
+                        if extracted
+                        for token in [self._extraction_token(file)]
+                        if token
+                    ],
+                )
+                self._dir_listing_cache.clear()
+                queue.append((dest, os.path.join(dest, COLLECTINFO_INTERNAL_DIR)))
@@ -92,6 +92,10 @@ class ASSocket:
             sock_addr = addrinfo[4]
 
             sock = socket.socket(addr_family, socket.SOCK_STREAM)
+            # Admin/info exchanges are small request/response pairs; disable
+            # Nagle so the tiny request buffers are not held back waiting for
+            # ACKs of previous responses.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             sock = self._wrap_socket(sock, self.ssl_context)
             sock.setblocking(False)
 
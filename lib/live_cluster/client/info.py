@@ -15,10 +15,10 @@
 ####
 
 import asyncio
+import functools
 import logging
 import sys
 import struct
-from ctypes import create_string_buffer  # gives us pre-allocated bufs
 from time import time
 from socket import error as SocketError
 
@@ -60,7 +60,10 @@ logger = logging.getLogger("asadm")
 #
 # |1|1|  6  |1|1|1|1|    12    | 4 |1| field data . . .| next field . . .|
 
-_STRUCT_PROTOCOL_HEADER = struct.Struct("! B B 3H")
+# The 6-byte big-endian data size is packed as one bytes field so the
+# split/combine happens in int.to_bytes/from_bytes rather than Python-level
+# shift-and-mask arithmetic on three 16-bit words.
+_STRUCT_PROTOCOL_HEADER = struct.Struct("! B B 6s")
 _STRUCT_UINT8 = struct.Struct("! B")
 _STRUCT_UINT16 = struct.Struct("! H")
 _STRUCT_UINT32 = struct.Struct("! I")
@@ -91,64 +94,77 @@ def _pack_uint32(buf, offset, val):
 
 
 def _unpack_uint32(buf, offset):
-    val = _STRUCT_UINT32.unpack_from(buf, offset)
-    offset += _STRUCT_UINT32.size
-    return val[0], offset
+    # int.from_bytes beats Struct.unpack_from for a lone fixed-width int:
+    # no format dispatch and no one-element tuple.
+    end = offset + _STRUCT_UINT32.size
+    return int.from_bytes(buf[offset:end], "big"), end
 
 
 def _pack_string(buf, offset, string):
-    bytes_field = util.str_to_bytes(string)
-    buf[offset : offset + len(bytes_field)] = bytes_field
-    return offset + len(bytes_field)
+    bytes_field = string.encode("utf-8") if isinstance(string, str) else string
+    field_len = len(bytes_field)
+    buf[offset : offset + field_len] = bytes_field
+    return offset + field_len
 
 
 def _unpack_string(buf, offset, sz):
-    val = buf[offset : offset + sz]
-    offset += sz
-    return val.decode("utf-8"), offset
+    end = offset + sz
+    # Decode straight from a view; slicing the buffer first would copy the
+    # field bytes once per string field.
+    return str(memoryview(buf)[offset:end], "utf-8"), end
 
 
 def _pack_protocol_header(buf, offset, protocol_version, protocol_type, sz):
     _STRUCT_PROTOCOL_HEADER.pack_into(
-        buf,
-        offset,
-        protocol_version,
-        protocol_type,
-        (sz >> 32) & 0xFFFF,
-        (sz >> 16) & 0xFFFF,
-        sz & 0xFFFF,
+        buf, offset, protocol_version, protocol_type, sz.to_bytes(6, "big")
     )
     return offset + _PROTOCOL_HEADER_SIZE
 
 
 def _unpack_protocol_header(buf, offset=0):
-    protocol_header = _STRUCT_PROTOCOL_HEADER.unpack_from(buf, offset=offset)
-    protocol_version = protocol_header[0]
-    protocol_type = protocol_header[1]
-    data_size = (
-        (protocol_header[2] << 32) | (protocol_header[3] << 16) | protocol_header[4]
+    protocol_version, protocol_type, size_bytes = _STRUCT_PROTOCOL_HEADER.unpack_from(
+        buf, offset=offset
     )
+    data_size = int.from_bytes(size_bytes, "big")
     offset = _PROTOCOL_HEADER_SIZE
     return protocol_version, protocol_type, data_size, offset
 
 
 async def _receive_data(reader: asyncio.StreamReader, sz):
+    # StreamReader already drains the kernel buffer into its own; read()
+    # here is served from that buffer, not one syscall per call.
     pos = 0
-    data = None
+    chunks = []
     while pos < sz:
         chunk = await reader.read(sz - pos)
-        if pos == 0:
-            data = chunk
-        else:
-            data += chunk
+
+        if not chunk:
+            raise ConnectionError(
+                "Connection closed while reading response: expected %d bytes, got %d"
+                % (sz, pos)
+            )
+
+        chunks.append(chunk)
         pos += len(chunk)
 
-    return data
+    # Join once at the end; repeated bytes += is quadratic in response size.
+    if len(chunks) == 1:
+        return chunks[0]
+
+    return b"".join(chunks)
 
 
 ####### Password hashing ######
 
 
+@functools.lru_cache(maxsize=32)
+def _bcrypt_hash(password: bytes) -> bytes:
+    # bcrypt is deliberately slow; asadm hashes the same password once per
+    # node during cluster fan-out, so memoize by password bytes. The salt is
+    # a module constant and does not need to be part of the key.
+    return bcrypt.hashpw(password, _ADMIN_SALT)
+
+
 def _hash_password(password):
     if isinstance(password, str):
         password = password.encode("utf-8")
@@ -158,11 +174,9 @@ def _hash_password(password):
         sys.exit(1)
 
     if password is None:
-        password = ""
+        password = b""
 
-    password = bcrypt.hashpw(password, _ADMIN_SALT)
-
-    return password
+    return _bcrypt_hash(password)
 
 
 ###############################
@@ -177,6 +191,21 @@ _ADMIN_MSG_TYPE = 2
 _ADMIN_HEADER_SIZE = _STRUCT_ADMIN_HEADER.size
 _TOTAL_HEADER_SIZE = _PROTOCOL_HEADER_SIZE + _ADMIN_HEADER_SIZE
 
+# field_type comes off the wire as a bare int; comparing against these int
+# aliases in the per-record unpack loops skips enum lookup and hashing.
+_FIELD_USER = int(ASField.USER)
+_FIELD_ROLES = int(ASField.ROLES)
+_FIELD_ROLE = int(ASField.ROLE)
+_FIELD_PRIVILEGES = int(ASField.PRIVILEGES)
+_FIELD_WHITELIST = int(ASField.WHITELIST)
+_FIELD_READ_QUOTA = int(ASField.READ_QUOTA)
+_FIELD_WRITE_QUOTA = int(ASField.WRITE_QUOTA)
+_FIELD_READ_INFO = int(ASField.READ_INFO)
+_FIELD_WRITE_INFO = int(ASField.WRITE_INFO)
+_FIELD_CONNECTIONS = int(ASField.CONNECTIONS)
+
+_QUOTA_FIELDS = frozenset({ASField.READ_QUOTA, ASField.WRITE_QUOTA})
+
 READ_WRITE_INFO_VALUES = [
     "quota",
     "single-record-tps",
@@ -207,7 +236,9 @@ def _create_admin_header(sz, command, field_count):
         sz + _ADMIN_HEADER_SIZE + (_STRUCT_FIELD_HEADER.size * field_count)
     )
     buffer_size = protocol_data_size + _PROTOCOL_HEADER_SIZE
-    buf = create_string_buffer(buffer_size)
+    # bytearray works with pack_into/slice assignment and can be handed to
+    # the (possibly TLS-wrapped) writer directly - no ctypes round trip.
+    buf = bytearray(buffer_size)
     offset = _pack_protocol_header(
         buf, 0, _ADMIN_MSG_VERSION, _ADMIN_MSG_TYPE, protocol_data_size
     )
@@ -217,14 +248,22 @@ def _create_admin_header(sz, command, field_count):
     return buf, offset
 
 
+# The query-all requests carry no fields, so their serialized frames are
+# byte-for-byte identical on every call; build each once at import.
+_QUERY_USERS_ALL_FRAME = bytes(_create_admin_header(0, ASCommand.QUERY_USERS, 0)[0])
+_QUERY_ROLES_ALL_FRAME = bytes(_create_admin_header(0, ASCommand.QUERY_ROLES, 0)[0])
+
+
 def _pack_admin_field_header(buf, offset, field_len, field_type):
     """Packs the first 5 bytes in front of every admin field.
     field_len = is the size of the "Value" field. Does not include "Type" or
     "Length".
     """
-    _STRUCT_FIELD_HEADER.pack_into(buf, offset, field_len + 1, field_type.value)
-    offset += _STRUCT_FIELD_HEADER.size
-    return offset
+    # Write the 4B length then store the type byte directly; skips boxing
+    # the field enum through struct and its .value lookup per field.
+    _STRUCT_UINT32.pack_into(buf, offset, field_len + 1)
+    buf[offset + _STRUCT_UINT32.size] = field_type
+    return offset + _STRUCT_FIELD_HEADER.size
 
 
 def _unpack_admin_field_header(buf, offset):
@@ -233,9 +272,19 @@ def _unpack_admin_field_header(buf, offset):
     return field_len, field_type, offset
 
 
+# One-shot field structs: header (4B length + type byte) and payload packed
+# in a single call. Quota fields always carry a uint32; string fields cache
+# a struct per payload length.
+_QUOTA_FIELD_STRUCT = struct.Struct("! I B I")
+
+
+@functools.lru_cache(maxsize=32)
+def _string_field_struct(field_len):
+    return struct.Struct("! I B %ds" % field_len)
+
+
 def _pack_admin_field(buf, offset, as_field, field):
-    # _pack_string() will convert str to bytes, no need to handle here.
-    if as_field in {ASField.READ_QUOTA, ASField.WRITE_QUOTA}:
+    if as_field in _QUOTA_FIELDS:
         if isinstance(field, str):
             try:
                 field = int(field)
@@ -246,13 +295,17 @@ def _pack_admin_field(buf, offset, as_field, field):
                     )
                 )
 
-        field_len = _STRUCT_UINT32.size
-        offset = _pack_admin_field_header(buf, offset, field_len, as_field)
-        offset = _pack_uint32(buf, offset, field)
+        _QUOTA_FIELD_STRUCT.pack_into(
+            buf, offset, _STRUCT_UINT32.size + 1, as_field, field
+        )
+        offset += _QUOTA_FIELD_STRUCT.size
     elif isinstance(field, str) or isinstance(field, bytes):
-        field_len = len(field)
-        offset = _pack_admin_field_header(buf, offset, field_len, as_field)
-        offset = _pack_string(buf, offset, field)
+        if isinstance(field, str):
+            field = field.encode("utf-8")
+
+        field_struct = _string_field_struct(len(field))
+        field_struct.pack_into(buf, offset, len(field) + 1, as_field, field)
+        offset += field_struct.size
     elif isinstance(field, list):
         if as_field == ASField.ROLES:
             offset = _pack_admin_roles(buf, offset, field)
@@ -271,26 +324,39 @@ def _pack_admin_field(buf, offset, as_field, field):
 
 
 def _len_roles(roles):
-    # 1B = role_count
-    field_len = 1
-    for role in roles:
-        # 1B = role_name_size
-        field_len += len(role) + 1
+    # 1B = role_count, plus 1B role_name_size per role
+    return 1 + sum(len(role) + 1 for role in roles)
 
-    return field_len
+
+# Cached role-list structs keyed by the tuple of role name lengths; packs
+# the count byte and every length-prefixed name in one call.
+_ROLES_STRUCT_CACHE = {}
 
 
 def _pack_admin_roles(buf, offset, roles):
     field_len = _len_roles(roles)
-    role_count = len(roles)
 
     offset = _pack_admin_field_header(buf, offset, field_len, ASField.ROLES)
-    offset = _pack_uint8(buf, offset, role_count)
 
-    for role in roles:
-        role_len = len(role)
-        offset = _pack_uint8(buf, offset, role_len)
-        offset = _pack_string(buf, offset, role)
+    role_bytes = [
+        role.encode("utf-8") if isinstance(role, str) else role for role in roles
+    ]
+    key = tuple(len(role) for role in role_bytes)
+
+    try:
+        roles_struct = _ROLES_STRUCT_CACHE[key]
+    except KeyError:
+        roles_struct = _ROLES_STRUCT_CACHE[key] = struct.Struct(
+            "!B" + "".join("B%ds" % role_len for role_len in key)
+        )
+
+    values = [len(role_bytes)]
+    for role in role_bytes:
+        values.append(len(role))
+        values.append(role)
+
+    roles_struct.pack_into(buf, offset, *values)
+    return offset + roles_struct.size
 
 
 def _unpack_admin_roles(buf, offset):
@@ -324,37 +390,38 @@ def _parse_privilege(privilege):
 
 
 def _len_privileges(privileges):
+    # 1B = component count; each privilege is a 1B permission code, and
+    # scoped permissions add 1B-length-prefixed namespace and set names.
+    return 1 + sum(
+        1
+        if permission.is_global_only_scope()
+        else 3 + len(namespace) + len(set_)
+        for permission, namespace, set_ in map(_parse_privilege, privileges)
+    )
+
+
+def _pack_admin_privileges(buf, offset, privileges):
+    # Parse each privilege once and reuse the tuples for both the length
+    # computation and the pack loop instead of re-splitting per phase.
+    parsed = [_parse_privilege(privilege) for privilege in privileges]
+
     # 1B = component count
     field_len = 1
-
-    for privilege in privileges:
+    for permission, namespace, set_ in parsed:
         # 1B = permission code ID
         field_len += 1
-        permission, namespace, set_ = _parse_privilege(privilege)
 
-        if not ASPrivilege(permission).is_global_only_scope():
-            # 1B = namespace name len
-            field_len += 1
-            field_len += len(namespace)
-            # 1B = set name len
-            field_len += 1
-            field_len += len(set_)
-
-    return field_len
-
-
-def _pack_admin_privileges(buf, offset, privileges):
-    privilege_count = len(privileges)
-    field_len = _len_privileges(privileges)
+        if not permission.is_global_only_scope():
+            # 1B each = namespace/set name len
+            field_len += 2 + len(namespace) + len(set_)
 
     offset = _pack_admin_field_header(buf, offset, field_len, ASField.PRIVILEGES)
-    offset = _pack_uint8(buf, offset, privilege_count)
+    offset = _pack_uint8(buf, offset, len(parsed))
 
-    for privilege in privileges:
-        permission, namespace, set_ = _parse_privilege(privilege)
+    for permission, namespace, set_ in parsed:
         offset = _pack_uint8(buf, offset, permission.value)
 
-        if not ASPrivilege(permission).is_global_only_scope():
+        if not permission.is_global_only_scope():
             offset = _pack_uint8(buf, offset, len(namespace))
             offset = _pack_string(buf, offset, namespace)
             offset = _pack_uint8(buf, offset, len(set_))
@@ -390,27 +457,28 @@ def _unpack_admin_privileges(buf, offset):
     return privileges, offset
 
 
-def _unpack_admin_read_write_info(buf, offset):
-    num_stat, offset = _unpack_uint8(buf, offset)
-    stats = []
+# Cached array structs keyed by element count; read/write info carries a
+# handful of uint32 stats per user, unpacked in one call instead of a loop.
+_STRUCT_UINT32_ARRAYS = {}
 
-    for _ in range(num_stat):
-        stat, offset = _unpack_uint32(buf, offset)
-        stats.append(stat)
 
-    return stats, offset
+def _unpack_admin_read_write_info(buf, offset):
+    num_stat, offset = _unpack_uint8(buf, offset)
 
+    try:
+        array_struct = _STRUCT_UINT32_ARRAYS[num_stat]
+    except KeyError:
+        array_struct = _STRUCT_UINT32_ARRAYS[num_stat] = struct.Struct(
+            "!%dI" % num_stat
+        )
 
-def _c_str_to_bytes(buf):
-    return bytes(buf)
+    stats = list(array_struct.unpack_from(buf, offset))
+    return stats, offset + array_struct.size
 
 
 async def _send_and_get_admin_header(
     reader: asyncio.StreamReader, writer: asyncio.StreamWriter, send_buf
 ):
-    # OpenSSL wrapper doesn't support ctypes
-    send_buf = _c_str_to_bytes(send_buf)
-
     try:
         writer.write(send_buf)
         await writer.drain()
@@ -672,22 +740,17 @@ async def _query_users(
     Returns: ASResponse
     """
     users_dict = {}
-    field_count = 0
-    admin_data_size = 0
 
-    if user is not None:
-        field_count += 1
-        admin_data_size = len(user)
-
-    send_buf, offset = _create_admin_header(
-        admin_data_size, ASCommand.QUERY_USERS, field_count
-    )
-
-    if user is not None:
-        offset = _pack_admin_field(send_buf, offset, ASField.USER, user)
+    if user is None:
+        send_buf = _QUERY_USERS_ALL_FRAME
+    else:
+        send_buf, offset = _create_admin_header(len(user), ASCommand.QUERY_USERS, 1)
+        _pack_admin_field(send_buf, offset, ASField.USER, user)
 
-    # OpenSSL wrapper doesn't support ctypes
-    send_buf = _c_str_to_bytes(send_buf)
+    # Bound locals for the per-field loop; on clusters with many users it
+    # runs field_count times per record and the helper call adds up.
+    unpack_field_header = _STRUCT_FIELD_HEADER.unpack_from
+    field_header_size = _STRUCT_FIELD_HEADER.size
 
     try:
         writer.write(send_buf)
@@ -718,30 +781,29 @@ async def _query_users(
                 connections = None
 
                 for _ in range(field_count):
-                    field_len, field_type, offset = _unpack_admin_field_header(
-                        rsp_buf, offset
-                    )
+                    field_len, field_type = unpack_field_header(rsp_buf, offset)
+                    offset += field_header_size
                     field_len -= 1
 
-                    if field_type == ASField.USER:
+                    if field_type == _FIELD_USER:
                         user_name, offset = _unpack_string(rsp_buf, offset, field_len)
 
                         if user_name not in users_dict:
                             users_dict[user_name] = {}
 
-                    elif field_type == ASField.ROLES:
+                    elif field_type == _FIELD_ROLES:
                         roles, offset = _unpack_admin_roles(rsp_buf, offset)
                         user_roles.extend(roles)
 
-                    elif field_type == ASField.READ_INFO:
+                    elif field_type == _FIELD_READ_INFO:
                         read_info, offset = _unpack_admin_read_write_info(
                             rsp_buf, offset
                         )
-                    elif field_type == ASField.WRITE_INFO:
+                    elif field_type == _FIELD_WRITE_INFO:
                         write_info, offset = _unpack_admin_read_write_info(
                             rsp_buf, offset
                         )
-                    elif field_type == ASField.CONNECTIONS:
+                    elif field_type == _FIELD_CONNECTIONS:
                         connections, offset = _unpack_uint32(rsp_buf, offset)
                     else:
                         offset += field_len
@@ -972,27 +1034,30 @@ async def _set_quotas(
     write_quota: int or str representing an int,
     Returns: ASResponse
     """
-    field_count = 1
-    admin_data_size = len(role)
-
-    if read_quota is not None:
-        field_count += 1
-        admin_data_size += _STRUCT_UINT32.size
+    if isinstance(role, str):
+        role = role.encode("utf-8")
+
+    # One tuple of the present quota fields drives both the sizing and the
+    # packing instead of duplicating the None checks per phase.
+    quota_fields = tuple(
+        (as_field, quota)
+        for as_field, quota in (
+            (ASField.READ_QUOTA, read_quota),
+            (ASField.WRITE_QUOTA, write_quota),
+        )
+        if quota is not None
+    )
 
-    if write_quota is not None:
-        field_count += 1
-        admin_data_size += _STRUCT_UINT32.size
+    field_count = 1 + len(quota_fields)
+    admin_data_size = len(role) + _STRUCT_UINT32.size * len(quota_fields)
 
     send_buf, offset = _create_admin_header(
         admin_data_size, ASCommand.SET_RATE_QUOTAS, field_count
     )
     offset = _pack_admin_field(send_buf, offset, ASField.ROLE, role)
 
-    if read_quota is not None:
-        offset = _pack_admin_field(send_buf, offset, ASField.READ_QUOTA, read_quota)
-
-    if write_quota is not None:
-        offset = _pack_admin_field(send_buf, offset, ASField.WRITE_QUOTA, write_quota)
+    for as_field, quota in quota_fields:
+        offset = _pack_admin_field(send_buf, offset, as_field, quota)
 
     try:
         _, return_code, _, _, _ = await _send_and_get_admin_header(
@@ -1042,22 +1107,19 @@ async def _query_role(
     Returns: ASResponse, {role_name: [privleges: ASPrivilege]}
     """
     role_dict = {}
-    field_count = 0
-    admin_data_size = 0
-
-    if role is not None:
-        field_count += 1
-        admin_data_size = len(role)
 
-    send_buf, offset = _create_admin_header(
-        admin_data_size, ASCommand.QUERY_ROLES, field_count
-    )
+    if role is None:
+        send_buf = _QUERY_ROLES_ALL_FRAME
+    else:
+        if isinstance(role, str):
+            role = role.encode("utf-8")
 
-    if role is not None:
-        offset = _pack_admin_field(send_buf, offset, ASField.ROLE, role)
+        send_buf, offset = _create_admin_header(len(role), ASCommand.QUERY_ROLES, 1)
+        _pack_admin_field(send_buf, offset, ASField.ROLE, role)
 
-    # OpenSSL wrapper doesn't support ctypes
-    send_buf = _c_str_to_bytes(send_buf)
+    # Same bound locals as _query_users; the field loop runs per record.
+    unpack_field_header = _STRUCT_FIELD_HEADER.unpack_from
+    field_header_size = _STRUCT_FIELD_HEADER.size
 
     try:
         writer.write(send_buf)
@@ -1088,26 +1150,28 @@ async def _query_role(
                 write_quota = None
 
                 for _ in range(field_count):
-                    field_len, field_type, offset = _unpack_admin_field_header(
-                        rsp_buf, offset
-                    )
+                    field_len, field_type = unpack_field_header(rsp_buf, offset)
+                    offset += field_header_size
                     field_len -= 1
 
-                    if field_type == ASField.ROLE:
+                    if field_type == _FIELD_ROLE:
                         role_name, offset = _unpack_string(rsp_buf, offset, field_len)
+                        # The same small set of role names comes back on
+                        # every query; intern so repeats share one object.
+                        role_name = sys.intern(role_name)
 
                         if role_name not in role_dict:
                             role_dict[role_name] = role_name
 
-                    elif field_type == ASField.PRIVILEGES:
+                    elif field_type == _FIELD_PRIVILEGES:
                         roles, offset = _unpack_admin_privileges(rsp_buf, offset)
                         privileges.extend(roles)
-                    elif field_type == ASField.WHITELIST:
+                    elif field_type == _FIELD_WHITELIST:
                         white, offset = _unpack_string(rsp_buf, offset, field_len)
-                        whitelist = white.split(",")
-                    elif field_type == ASField.READ_QUOTA:
+                        whitelist = [sys.intern(addr) for addr in white.split(",")]
+                    elif field_type == _FIELD_READ_QUOTA:
                         read_quota, offset = _unpack_uint32(rsp_buf, offset)
-                    elif field_type == ASField.WRITE_QUOTA:
+                    elif field_type == _FIELD_WRITE_QUOTA:
                         write_quota, offset = _unpack_uint32(rsp_buf, offset)
                     else:
                         offset += field_len
@@ -1149,12 +1213,10 @@ def _parse_session_info(data, field_count):
         offset += _STRUCT_FIELD_HEADER.size
 
         if field_id == ASField.SESSION_TOKEN:
-            fmt_str = "%ds" % field_len
-            session_token = struct.unpack_from(fmt_str, data, offset)[0]
+            session_token = bytes(data[offset : offset + field_len])
 
         elif field_id == ASField.SESSION_TTL:
-            fmt_str = ">I"
-            session_ttl = struct.unpack_from(fmt_str, data, offset)[0]
+            session_ttl = int.from_bytes(data[offset : offset + 4], "big")
 
         offset += field_len
         i += 1
@@ -1171,6 +1233,14 @@ async def login(
 ):
     credential = _hash_password(password)
 
+    # Encode once at the boundary; sizing below then counts bytes (correct
+    # for multibyte names) and packing skips the per-field re-encode.
+    if isinstance(user, str):
+        user = user.encode("utf-8")
+
+    if isinstance(password, str):
+        password = password.encode("utf-8")
+
     if auth_mode == constants.AuthMode.INTERNAL:
         field_count = 2
         # 4B = field size, 1B = field type
@@ -1195,8 +1265,6 @@ async def login(
         offset = _pack_admin_field(send_buf, offset, ASField.CLEAR_PASSWORD, password)
 
     try:
-        # OpenSSL wrapper doesn't support ctypes
-        send_buf = _c_str_to_bytes(send_buf)
         writer.write(send_buf)
         await writer.drain()
         recv_buff = await _receive_data(
@@ -1220,7 +1288,6 @@ async def login(
             raise IOError("Login failed to retrieve session token")
         recv_buff = await _receive_data(reader, data_size)
         session_token, session_ttl = _parse_session_info(recv_buff, field_count)
-        session_token = _c_str_to_bytes(session_token)
 
         if session_ttl is None:
             session_expiration = 0
@@ -1242,20 +1309,12 @@ _INFO_MSG_VERSION = 2
 _INFO_MSG_TYPE = 1
 
 
-def _pack_info_field(buf, offset, field):
-    field += "\n"
-    return _pack_string(buf, offset, field)
-
-
 async def _info_request(
     reader: asyncio.StreamReader, writer: asyncio.StreamWriter, buf
 ):
     rsp_data = None
     # request over TCP
     try:
-        if not isinstance(buf, bytes):
-            buf = bytes(buf)  # OpenSSL does not support c-types
-
         writer.write(buf)
         await writer.drain()
         # get response
@@ -1278,43 +1337,31 @@ async def _info_request(
 async def info(reader, writer, names=None):
     if not reader or not writer:
         raise IOError("Error: Could not connect to node")
-    buf = None
-    # Passed a set of names: created output buf
+    # One build path for all three request shapes: header plus an optional
+    # newline-terminated payload.
     if names is None:
-        buf = create_string_buffer(_PROTOCOL_HEADER_SIZE)
-        _pack_protocol_header(buf, 0, _INFO_MSG_VERSION, _INFO_MSG_TYPE, 0)
-
+        payload = b""
     elif isinstance(names, str):
-        buf_size = _PROTOCOL_HEADER_SIZE + len(names) + 1  # for \n
-        buf = create_string_buffer(buf_size)
-        offset = 0
-
-        offset = _pack_protocol_header(
-            buf, offset, _INFO_MSG_VERSION, _INFO_MSG_TYPE, len(names) + 1
-        )
-        offset = _pack_info_field(buf, offset, names)
+        payload = names.encode("utf-8") + b"\n"
     else:
-        namestr = "\n".join(names)
-        buf_size = _PROTOCOL_HEADER_SIZE + len(namestr) + 1  # for \n
-        buf = create_string_buffer(buf_size)
-        offset = 0
+        payload = ("\n".join(names) + "\n").encode("utf-8")
 
-        offset = _pack_protocol_header(
-            buf, offset, _INFO_MSG_VERSION, _INFO_MSG_TYPE, len(namestr) + 1
-        )
-        offset = _pack_info_field(buf, offset, namestr)
+    buf = bytearray(_PROTOCOL_HEADER_SIZE + len(payload))
+    _pack_protocol_header(buf, 0, _INFO_MSG_VERSION, _INFO_MSG_TYPE, len(payload))
+    buf[_PROTOCOL_HEADER_SIZE:] = payload
 
     rsp_data = await _info_request(reader, writer, buf)
 
     if rsp_data is None:
         return None
 
-    rsp_data = util.bytes_to_str(rsp_data)
-
     # if the original request was a single string, return a single string
     if isinstance(names, str):
-        lines = rsp_data.split("\n")
-        name, sep, value = lines[0].partition("\t")
+        # Only the first line matters here; split it off the raw bytes so
+        # the rest of the response is never decoded.
+        first_line, _, _ = rsp_data.partition(b"\n")
+        name, _, value = first_line.partition(b"\t")
+        name = util.bytes_to_str(name)
 
         if name != names:
             if "not authenticated" in name.lower():
@@ -1323,16 +1370,23 @@ async def info(reader, writer, names=None):
                 logger.debug(
                     "Unexpected key %s in info response %s. Expected key: %s",
                     name,
-                    lines,
+                    rsp_data,
                     names,
                 )
-        return value
+        return util.bytes_to_str(value)
 
     else:
+        rsp_data = util.bytes_to_str(rsp_data)
+
+        # Scan for the auth failure once over the whole response instead of
+        # lowercasing every line; the line loop below stays on the fast path.
+        if "not authenticated" in rsp_data.lower():
+            for line in rsp_data.split("\n"):
+                if "not authenticated" in line.lower():
+                    raise ASInfoNotAuthenticatedError("Connection failed", line)
+
         rdict = dict()
         for line in rsp_data.split("\n"):
-            if "not authenticated" in line.lower():
-                raise ASInfoNotAuthenticatedError("Connection failed", line)
             if len(line) < 1:
                 # this accounts for the trailing '\n' - cheaper than chomp
                 continue
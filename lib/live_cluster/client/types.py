@@ -77,38 +77,35 @@ class ASPrivilege(IntEnum):
     def str_to_enum(cls, privilege_str):
         privilege_str = privilege_str.lower()
         privilege_str = privilege_str.replace("_", "-")
-
-        str_to_enum_map = {
-            "user-admin": cls.USER_ADMIN,
-            "sys-admin": cls.SYS_ADMIN,
-            "data-admin": cls.DATA_ADMIN,
-            "udf-admin": cls.UDF_ADMIN,
-            "sindex-admin": cls.SINDEX_ADMIN,
-            "read": cls.READ,
-            "read-write": cls.READ_WRITE,
-            "read-write-udf": cls.READ_WRITE_UDF,
-            "write": cls.WRITE,
-            "truncate": cls.TRUNCATE,
-        }
-
-        if privilege_str in str_to_enum_map:
-            return str_to_enum_map[privilege_str]
-        else:
-            return cls.ERROR
+        return _PRIVILEGE_STR_TO_ENUM.get(privilege_str, cls.ERROR)
 
     def is_global_only_scope(self):
-        return (
-            self == ASPrivilege.DATA_ADMIN
-            or self == ASPrivilege.SYS_ADMIN
-            or self == ASPrivilege.USER_ADMIN
-            or self == ASPrivilege.UDF_ADMIN
-            or self == ASPrivilege.SINDEX_ADMIN
-        )
+        return self in _GLOBAL_ONLY_PRIVILEGES
 
     def __str__(self):
-        name = self.name.lower()
-        name = name.replace("_", "-")
-        return name
+        return _PRIVILEGE_ENUM_TO_STR[self]
+
+
+# Built once at import; str_to_enum/__str__/is_global_only_scope run per
+# privilege in the admin pack/unpack loops and should not rebuild these
+# every call.
+_GLOBAL_ONLY_PRIVILEGES = frozenset(
+    {
+        ASPrivilege.DATA_ADMIN,
+        ASPrivilege.SYS_ADMIN,
+        ASPrivilege.USER_ADMIN,
+        ASPrivilege.UDF_ADMIN,
+        ASPrivilege.SINDEX_ADMIN,
+    }
+)
+_PRIVILEGE_ENUM_TO_STR = {
+    privilege: privilege.name.lower().replace("_", "-") for privilege in ASPrivilege
+}
+_PRIVILEGE_STR_TO_ENUM = {
+    name: privilege
+    for privilege, name in _PRIVILEGE_ENUM_TO_STR.items()
+    if privilege is not ASPrivilege.ERROR
+}
 
 
 @unique
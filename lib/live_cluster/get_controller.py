@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import asyncio
-import copy
+from collections import Counter
 from typing import Iterable, Optional
 from lib.base_get_controller import BaseGetConfigController
 
@@ -22,6 +22,10 @@ from lib.utils.types import NodeDict, DatacenterDict, NamespaceDict
 from .client import Cluster
 
 
+# Each namespace is divided into 4096 partitions
+PID_RANGE = 4096
+
+
 # Helpers
 def _union_iterable(vals: Iterable[Iterable[str]]) -> set[str]:
     val_set = set()
@@ -33,13 +37,51 @@ def _union_iterable(vals: Iterable[Iterable[str]]) -> set[str]:
     return val_set
 
 
-async def _get_all_dcs(cluster, nodes) -> set[str]:
-    dcs_dict = await cluster.info_dcs(nodes=nodes)
+class _InfoRequestCache:
+    """
+    Request-scoped memo for identical cluster info calls so that sibling
+    getters fired by a get_all share a single RPC (e.g. info_dcs and
+    info_namespaces are otherwise fetched once per xdr getter). A cache
+    only lives for one controller invocation; it must not outlive it since
+    live cluster data changes between commands.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    @staticmethod
+    def _freeze(value):
+        if isinstance(value, (list, set)):
+            return tuple(sorted(map(str, value)))
+        return value
+
+    def get_task(self, fn, *args, **kwargs):
+        key = (
+            fn.__name__,
+            tuple(self._freeze(arg) for arg in args),
+            tuple((k, self._freeze(v)) for k, v in sorted(kwargs.items())),
+        )
+        try:
+            return self._tasks[key]
+        except KeyError:
+            task = asyncio.create_task(fn(*args, **kwargs))
+            self._tasks[key] = task
+            return task
+
+
+async def _get_all_dcs(cluster, nodes, cache=None) -> set[str]:
+    if cache is not None:
+        dcs_dict = await cache.get_task(cluster.info_dcs, nodes=nodes)
+    else:
+        dcs_dict = await cluster.info_dcs(nodes=nodes)
     return _union_iterable(dcs_dict.values())
 
 
-async def _get_all_namespaces(cluster, nodes) -> set[str]:
-    namespaces_per_node = await cluster.info_namespaces(nodes=nodes)
+async def _get_all_namespaces(cluster, nodes, cache=None) -> set[str]:
+    if cache is not None:
+        namespaces_per_node = await cache.get_task(cluster.info_namespaces, nodes=nodes)
+    else:
+        namespaces_per_node = await cluster.info_namespaces(nodes=nodes)
     return _union_iterable(namespaces_per_node.values())
 
 
@@ -111,24 +153,58 @@ class GetLatenciesController:
         if latencies_data is None:
             return latency_data
 
-        # Make every new entry start out with 'N/A' for all values
-        for idx in range(len(latencies_data["values"])):
-            for jdx in range(len(latencies_data["values"][idx])):
-                latencies_data["values"][idx][jdx] = "N/A"
+        # Make every new entry start out with 'N/A' for all values. Replace
+        # each row in place: latencies_data is a shallow copy of the table
+        # entry, so the values list itself is shared but the dict is not.
+        values = latencies_data["values"]
+        for idx, row in enumerate(values):
+            values[idx] = ["N/A"] * len(row)
 
         if latency_data is None:
             return
 
         # See if any columns in latencies_data match latency_data and copy them
-        # over.
+        # over. Index the source columns once rather than a linear .index()
+        # scan per matching column.
+        src_idx = {col: idx for idx, col in enumerate(latency_data["columns"])}
+
         for col_idx, col in enumerate(latencies_data["columns"]):
-            if col in latency_data["columns"]:
-                val_idx = latency_data["columns"].index(col)
+            if col in src_idx:
+                val_idx = src_idx[col]
                 for vals_idx in range(len(latencies_data["values"])):
                     latencies_data["values"][vals_idx][col_idx] = latency_data[
                         "values"
                     ][vals_idx][val_idx]
 
+    @staticmethod
+    def _make_empty_entry_from_schema(latencies_entry):
+        """
+        Build a latencies entry with the same schema as latencies_entry but
+        every value set to 'N/A'. Columns are shared; only the values lists
+        are allocated. Much cheaper than deepcopying the source entry just
+        to overwrite all of its values afterwards.
+        """
+
+        def empty_leaf(leaf):
+            return {
+                "columns": leaf["columns"],
+                "values": [["N/A"] * len(row) for row in leaf["values"]],
+            }
+
+        new_entry = {}
+        for histogram_name, histogram_data in latencies_entry.items():
+            new_data = {}
+            if "total" in histogram_data:
+                new_data["total"] = empty_leaf(histogram_data["total"])
+            if "namespace" in histogram_data:
+                new_data["namespace"] = {
+                    ns: empty_leaf(ns_data)
+                    for ns, ns_data in histogram_data["namespace"].items()
+                }
+            new_entry[histogram_name] = new_data
+
+        return new_entry
+
     # Merges latency tables into latencies table.  This is needed because a
     # latencies table can have different columns.
     def merge_latencies_and_latency_tables(self, latencies_table, latency_table):
@@ -141,7 +217,7 @@ class GetLatenciesController:
         for latencies_address in latencies_table:
             for latency_address in latency_table:
                 # Create entry with same schema as latencies_table
-                latencies_table[latency_address] = copy.deepcopy(
+                latencies_table[latency_address] = self._make_empty_entry_from_schema(
                     latencies_table[latencies_address]
                 )
             break
@@ -171,8 +247,16 @@ class GetLatenciesController:
     async def get_namespace_set(self, nodes) -> set[str]:
         return set(await _get_all_namespaces(self.cluster, nodes))
 
-    async def get_all(self, nodes, buckets, exponent_increment, verbose, ns_set=None):
-        latencies_nodes, latency_nodes = await self.get_latencies_and_latency_nodes()
+    async def get_all(
+        self, nodes, buckets, exponent_increment, verbose, ns_set=None, nodes_split=None
+    ):
+        # Callers that already classified nodes by latency support can pass
+        # the (latencies_nodes, latency_nodes) tuple to avoid a second
+        # info_build round trip.
+        if nodes_split is None:
+            nodes_split = await self.get_latencies_and_latency_nodes()
+
+        latencies_nodes, latency_nodes = nodes_split
         latencies = None
 
         # all nodes support "show latencies"
@@ -232,14 +316,7 @@ async def get_sets(cluster, flip, nodes, for_mods: list[str] | None):
             if key[0] not in namespace_set or key[1] not in sets:
                 continue
 
-            if key not in set_stats:
-                set_stats[key] = {}
-            host_vals = set_stats[key]
-
-            if host_id not in host_vals:
-                host_vals[host_id] = {}
-            hv = host_vals[host_id]
-            hv.update(values)
+            set_stats.setdefault(key, {}).setdefault(host_id, {}).update(values)
 
     # Inverted match common structure of other getters, i.e. host is top level key
     if not flip:
@@ -253,6 +330,7 @@ class GetConfigController(BaseGetConfigController):
         self.cluster = cluster
 
     async def get_all(self, nodes="all"):
+        cache = _InfoRequestCache()
         futures = [
             (
                 constants.CONFIG_SECURITY,
@@ -264,7 +342,7 @@ class GetConfigController(BaseGetConfigController):
             ),
             (
                 constants.CONFIG_NAMESPACE,
-                asyncio.create_task(self.get_namespace(nodes=nodes)),
+                asyncio.create_task(self.get_namespace(nodes=nodes, cache=cache)),
             ),
             (
                 constants.CONFIG_SET,
@@ -275,14 +353,17 @@ class GetConfigController(BaseGetConfigController):
                 asyncio.create_task(self.get_network(nodes=nodes)),
             ),
             (constants.CONFIG_XDR, asyncio.create_task(self.get_xdr(nodes=nodes))),
-            (constants.CONFIG_DC, asyncio.create_task(self.get_xdr_dcs(nodes=nodes))),
+            (
+                constants.CONFIG_DC,
+                asyncio.create_task(self.get_xdr_dcs(nodes=nodes, cache=cache)),
+            ),
             (
                 constants.CONFIG_XDR_NS,
-                asyncio.create_task(self.get_xdr_namespaces(nodes=nodes)),
+                asyncio.create_task(self.get_xdr_namespaces(nodes=nodes, cache=cache)),
             ),
             (
                 constants.CONFIG_XDR_FILTER,
-                asyncio.create_task(self.get_xdr_filters(nodes=nodes)),
+                asyncio.create_task(self.get_xdr_filters(nodes=nodes, cache=cache)),
             ),
             (
                 constants.CONFIG_ROSTER,
@@ -340,26 +421,23 @@ class GetConfigController(BaseGetConfigController):
         return nw_configs
 
     async def get_namespace(
-        self, flip=False, nodes="all", for_mods: list[str] | None = None
+        self, flip=False, nodes="all", for_mods: list[str] | None = None, cache=None
     ):
-        namespace_set = set(await _get_all_namespaces(self.cluster, nodes))
+        namespace_set = set(await _get_all_namespaces(self.cluster, nodes, cache=cache))
         namespace_list = list(util.filter_list(namespace_set, for_mods))
         ns_configs = {}
-        ns_node_configs = []
 
-        ns_node_configs = [
-            asyncio.create_task(
+        ns_node_configs = await asyncio.gather(
+            *[
                 self.cluster.info_get_config(
                     stanza="namespace", namespace=namespace, nodes=nodes
                 )
-            )
-            for namespace in namespace_list
-        ]
+                for namespace in namespace_list
+            ]
+        )
 
         for namespace, node_configs in zip(namespace_list, ns_node_configs):
-            node_configs = await node_configs
-
-            for node, node_config in list(node_configs.items()):
+            for node, node_config in node_configs.items():
                 if (
                     not node_config
                     or isinstance(node_config, Exception)
@@ -401,9 +479,9 @@ class GetConfigController(BaseGetConfigController):
         return xdr_configs
 
     async def get_xdr_dcs(
-        self, flip=False, nodes="all", for_mods: list[str] | None = None
+        self, flip=False, nodes="all", for_mods: list[str] | None = None, cache=None
     ):
-        all_dcs = await _get_all_dcs(self.cluster, nodes)
+        all_dcs = await _get_all_dcs(self.cluster, nodes, cache=cache)
         filtered_dcs = list(util.filter_list(all_dcs, for_mods))
 
         result: NodeDict[
@@ -424,7 +502,9 @@ class GetConfigController(BaseGetConfigController):
 
         return result
 
-    async def get_xdr_namespaces(self, nodes="all", for_mods: list[str] | None = None):
+    async def get_xdr_namespaces(
+        self, nodes="all", for_mods: list[str] | None = None, cache=None
+    ):
         dcs_filter: list[str] | None = None
         namespaces_filter: list[str] | None = None
 
@@ -435,8 +515,8 @@ class GetConfigController(BaseGetConfigController):
             except IndexError:
                 pass
 
-        all_dcs = await _get_all_dcs(self.cluster, nodes)
-        all_namespaces = await _get_all_namespaces(self.cluster, nodes)
+        all_dcs = await _get_all_dcs(self.cluster, nodes, cache=cache)
+        all_namespaces = await _get_all_namespaces(self.cluster, nodes, cache=cache)
 
         filtered_dcs = list(util.filter_list(list(all_dcs), dcs_filter))
         filtered_namespaces = list(
@@ -467,7 +547,9 @@ class GetConfigController(BaseGetConfigController):
 
         return result
 
-    async def get_xdr_filters(self, nodes="all", for_mods: list[str] | None = None):
+    async def get_xdr_filters(
+        self, nodes="all", for_mods: list[str] | None = None, cache=None
+    ):
         dcs_filter: list[str] | None = None
         namespaces_filter: list[str] | None = None
         filtered_dcs = None
@@ -480,7 +562,7 @@ class GetConfigController(BaseGetConfigController):
                 pass
 
         if dcs_filter:
-            all_dcs = await _get_all_dcs(self.cluster, nodes)
+            all_dcs = await _get_all_dcs(self.cluster, nodes, cache=cache)
             filtered_dcs = list(util.filter_list(list(all_dcs), dcs_filter))
 
         result: NodeDict[
@@ -497,8 +579,10 @@ class GetConfigController(BaseGetConfigController):
                     result[host][dc] = {}
                     continue
 
-                filtered_namespaces = util.filter_list(
-                    list(dc_filters.keys()), namespaces_filter
+                # Materialize into a set: filter_list may return a lazy
+                # filter, and membership is checked once per namespace below.
+                filtered_namespaces = set(
+                    util.filter_list(dc_filters.keys(), namespaces_filter)
                 )
 
                 for ns in list(dc_filters.keys()):
@@ -563,6 +647,7 @@ class GetStatisticsController:
         self.cluster: Cluster = cluster
 
     async def get_all(self, nodes="all"):
+        cache = _InfoRequestCache()
         futures = [
             (
                 constants.STAT_SERVICE,
@@ -570,16 +655,19 @@ class GetStatisticsController:
             ),
             (
                 constants.STAT_NAMESPACE,
-                asyncio.create_task(self.get_namespace(nodes=nodes)),
+                asyncio.create_task(self.get_namespace(nodes=nodes, cache=cache)),
             ),
             (constants.STAT_SETS, asyncio.create_task(self.get_sets(nodes=nodes))),
             (constants.STAT_BINS, asyncio.create_task(self.get_bins(nodes=nodes))),
             (constants.STAT_SINDEX, asyncio.create_task(self.get_sindex(nodes=nodes))),
             (constants.STAT_XDR, asyncio.create_task(self.get_xdr(nodes=nodes))),
-            (constants.STAT_DC, asyncio.create_task(self.get_xdr_dcs(nodes=nodes))),
+            (
+                constants.STAT_DC,
+                asyncio.create_task(self.get_xdr_dcs(nodes=nodes, cache=cache)),
+            ),
             (
                 constants.STAT_XDR_NS,
-                asyncio.create_task(self.get_xdr_namespaces(nodes=nodes)),
+                asyncio.create_task(self.get_xdr_namespaces(nodes=nodes, cache=cache)),
             ),
         ]
 
@@ -591,19 +679,20 @@ class GetStatisticsController:
         service_stats = await self.cluster.info_statistics(nodes=nodes)
         return util.filter_exceptions(service_stats)
 
-    async def get_namespace(self, flip=False, nodes="all", for_mods=[]):
-        namespace_set = set(await _get_all_namespaces(self.cluster, nodes))
+    async def get_namespace(self, flip=False, nodes="all", for_mods=[], cache=None):
+        namespace_set = set(await _get_all_namespaces(self.cluster, nodes, cache=cache))
         namespace_list = list(util.filter_list(namespace_set, for_mods))
-        tasks = [
-            asyncio.create_task(
+        stats = await asyncio.gather(
+            *[
                 self.cluster.info_namespace_statistics(namespace, nodes=nodes)
-            )
-            for namespace in namespace_list
-        ]
+                for namespace in namespace_list
+            ],
+            return_exceptions=True,
+        )
         ns_stats = {}
 
-        for namespace, stat_task in zip(namespace_list, tasks):
-            ns_stats[namespace] = await stat_task
+        for namespace, stat in zip(namespace_list, stats):
+            ns_stats[namespace] = stat
 
             if isinstance(ns_stats[namespace], Exception):
                 continue
@@ -628,20 +717,26 @@ class GetStatisticsController:
 
         result = {}
         if stats:
+            ns_filter = None
+            sindex_filter = None
+
+            if for_mods is not None:
+                try:
+                    ns_filter = [for_mods[0]]
+                    sindex_filter = [for_mods[1]]
+                except IndexError:
+                    pass
+
+            # Fire one statistics RPC per unique sindex up front (shared
+            # across hosts that report it), then merge once they resolve,
+            # rather than awaiting each request inside the host loop.
+            stat_tasks = {}
+            matched_stats = []
+
             for host, stat_list in stats.items():
                 if not stat_list or isinstance(stat_list, Exception):
                     continue
 
-                ns_filter = None
-                sindex_filter = None
-
-                if for_mods is not None:
-                    try:
-                        ns_filter = [for_mods[0]]
-                        sindex_filter = [for_mods[1]]
-                    except IndexError:
-                        pass
-
                 namespace_set = {stat["ns"] for stat in stat_list}
                 namespace_set = set(util.filter_list(namespace_set, ns_filter))
 
@@ -661,21 +756,31 @@ class GetStatisticsController:
 
                     sindex_key = "%s %s %s" % (ns, set_, indexname)
 
-                    if sindex_key not in result:
+                    if sindex_key not in stat_tasks:
                         # Only call this once per sindex
-                        result[sindex_key] = await self.cluster.info_sindex_statistics(
-                            ns, indexname, nodes=nodes
+                        stat_tasks[sindex_key] = asyncio.create_task(
+                            self.cluster.info_sindex_statistics(
+                                ns, indexname, nodes=nodes
+                            )
                         )
 
-                    for node in list(result[sindex_key]):
-                        if not result[sindex_key][node] or isinstance(
-                            result[sindex_key][node], Exception
-                        ):
-                            del result[sindex_key][node]
-                            continue
+                    matched_stats.append((sindex_key, stat))
+
+            for sindex_key, stat_task in stat_tasks.items():
+                result[sindex_key] = await stat_task
+
+            for sindex_key, stat in matched_stats:
+                sindex_stats = result[sindex_key]
 
-                        for key, value in stat.items():
-                            result[sindex_key][node][key] = value
+                for node in list(sindex_stats):
+                    if not sindex_stats[node] or isinstance(
+                        sindex_stats[node], Exception
+                    ):
+                        del sindex_stats[node]
+                        continue
+
+                    for key, value in stat.items():
+                        sindex_stats[node][key] = value
 
         # Inverted match common structure of other getters, i.e. host is top level key
         if not flip:
@@ -731,9 +836,9 @@ class GetStatisticsController:
         return xdr_stats
 
     async def get_xdr_dcs(
-        self, flip=False, nodes="all", for_mods: list[str] | None = None
+        self, flip=False, nodes="all", for_mods: list[str] | None = None, cache=None
     ):
-        all_dcs = await _get_all_dcs(self.cluster, nodes)
+        all_dcs = await _get_all_dcs(self.cluster, nodes, cache=cache)
         filter_dcs = list(util.filter_list(list(all_dcs), for_mods))
 
         result = await self.cluster.info_all_dc_statistics(nodes=nodes, dcs=filter_dcs)
@@ -756,6 +861,7 @@ class GetStatisticsController:
         self,
         nodes="all",
         for_mods: Optional[list[str]] = None,
+        cache=None,
     ):
         dcs_filter: list[str] | None = None
         namespaces_filter: list[str] | None = None
@@ -767,8 +873,8 @@ class GetStatisticsController:
             except IndexError:
                 pass
 
-        all_dcs = await _get_all_dcs(self.cluster, nodes)
-        all_namespaces = await _get_all_namespaces(self.cluster, nodes)
+        all_dcs = await _get_all_dcs(self.cluster, nodes, cache=cache)
+        all_namespaces = await _get_all_namespaces(self.cluster, nodes, cache=cache)
 
         filtered_dcs = list(util.filter_list(list(all_dcs), dcs_filter))
         filtered_namespaces = list(
@@ -805,20 +911,28 @@ class GetFeaturesController:
         self.cluster = cluster
 
     async def get_features(self, nodes="all"):
+        # Resolve the cheap service statistics first; nodes that already
+        # error there would only produce discarded results from the five
+        # heavier RPCs, so those are issued against reachable nodes only.
+        service_stats = await self.cluster.info_statistics(nodes=nodes)
+        reachable_nodes = [
+            node
+            for node, stats in service_stats.items()
+            if not isinstance(stats, Exception)
+        ]
+
         (
-            service_stats,
             ns_stats,
             xdr_dc_stats,
             service_configs,
             ns_configs,
             security_configs,
         ) = await asyncio.gather(
-            self.cluster.info_statistics(nodes=nodes),
-            self.cluster.info_all_namespace_statistics(nodes=nodes),
-            self.cluster.info_all_dc_statistics(nodes=nodes),
-            self.cluster.info_get_config(stanza="service", nodes=nodes),
-            self.cluster.info_get_config(stanza="namespace", nodes=nodes),
-            self.cluster.info_get_config(stanza="security", nodes=nodes),
+            self.cluster.info_all_namespace_statistics(nodes=reachable_nodes),
+            self.cluster.info_all_dc_statistics(nodes=reachable_nodes),
+            self.cluster.info_get_config(stanza="service", nodes=reachable_nodes),
+            self.cluster.info_get_config(stanza="namespace", nodes=reachable_nodes),
+            self.cluster.info_get_config(stanza="security", nodes=reachable_nodes),
         )
 
         return common.find_nodewise_features(
@@ -846,6 +960,7 @@ class GetClusterMetadataController:
 class GetPmapController:
     def __init__(self, cluster):
         self.cluster = cluster
+        self._stats_getter = GetStatisticsController(cluster)
 
     def _get_namespace_data(self, namespace_stats, cluster_keys):
         ns_info = {}
@@ -858,26 +973,32 @@ class GetPmapController:
                 if isinstance(params, Exception):
                     continue
 
-                if cluster_keys[node] not in ns_info:
-                    ns_info[cluster_keys[node]] = {}
-
-                d = ns_info[cluster_keys[node]]
-                if ns not in d:
-                    d[ns] = {}
-
-                d = d[ns]
-                if node not in d:
-                    d[node] = {}
+                d = (
+                    ns_info.setdefault(cluster_keys[node], {})
+                    .setdefault(ns, {})
+                    .setdefault(node, {})
+                )
 
                 for s in stats:
                     util.set_value_in_dict(
-                        d[node], s, util.get_value_from_dict(params, (s,))
+                        d, s, util.get_value_from_dict(params, (s,))
                     )
 
         return ns_info
 
-    def _get_pmap_data(self, pmap_info, ns_info, cluster_keys, node_ids):
-        pid_range = 4096  # each namespace is divided into 4096 partition
+    def _merge_namespace_data(self, pmap_data, ns_info, cluster_keys):
+        for _node, _ns_data in pmap_data.items():
+            ck = cluster_keys[_node]
+
+            for ns, params in _ns_data.items():
+                params["cluster_key"] = ck
+
+                try:
+                    params.update(ns_info[ck][ns][_node])
+                except Exception:
+                    pass
+
+    def _get_pmap_data(self, pmap_info, cluster_keys, node_ids):
         pmap_data = {}
         ns_available_part = {}
 
@@ -917,59 +1038,113 @@ class GetPmapController:
             for t in required_fields + optional_old_fields + optional_new_fields:
                 f_indices[t[0]] = t[2]
 
-            # First row might be header, we need to check and set indices if its header row
-            index_set = False
+            items = partitions.split(";")
 
-            for item in partitions.split(";"):
-                fields = item.split(":")
+            # First row might be header, we need to check and set indices if its header row
+            # pmap format contains headers from server 3.8.4 onwards
+            if items:
+                fields = items[0].split(":")
 
-                if not index_set:
-                    # pmap format contains headers from server 3.8.4 onwards
-                    index_set = True
+                if all(i[1] in fields for i in required_fields):
+                    for t in required_fields:
+                        f_indices[t[0]] = fields.index(t[1])
 
-                    if all(i[1] in fields for i in required_fields):
-                        for t in required_fields:
+                    if all(i[1] in fields for i in optional_old_fields):
+                        for t in optional_old_fields:
+                            f_indices[t[0]] = fields.index(t[1])
+                    elif all(i[1] in fields for i in optional_new_fields):
+                        for t in optional_new_fields:
                             f_indices[t[0]] = fields.index(t[1])
 
-                        if all(i[1] in fields for i in optional_old_fields):
-                            for t in optional_old_fields:
-                                f_indices[t[0]] = fields.index(t[1])
-                        elif all(i[1] in fields for i in optional_new_fields):
-                            for t in optional_new_fields:
-                                f_indices[t[0]] = fields.index(t[1])
-
+                    items = items[1:]
+
+            # Bind indices to locals once; the per-partition loop runs 4096
+            # times per node and dict lookups per row add up.
+            ns_i = f_indices["namespace_index"]
+            pid_i = f_indices["partition_index"]
+            state_i = f_indices["state_index"]
+            replica_i = f_indices["replica_index"]
+            origin_i = f_indices["origin_index"]
+            target_i = f_indices["target_index"]
+            wm_i = f_indices["working_master_index"]
+
+            # Classify each row into a namespace bucket per role and let
+            # Counter do the tallying in C rather than incrementing dict
+            # entries per partition.
+            seen_namespaces = []
+            master_rows = []
+            prole_rows = []
+
+            if wm_i is not None:
+                # partition-info rows carry many more columns than the parse
+                # uses; capping split at the highest needed index keeps the
+                # remainder as one string instead of allocating a substring
+                # per unused column.
+                maxsplit = max(ns_i, pid_i, state_i, replica_i, wm_i) + 1
+
+                for item in items:
+                    fields = item.split(":", maxsplit)
+                    ns = fields[ns_i]
+                    pid = int(fields[pid_i])
+
+                    if pid < 0 or pid >= PID_RANGE:
+                        print(
+                            "For {0} found partition-ID {1} which is beyond legal partitions(0...4096)".format(
+                                ns, pid
+                            )
+                        )
                         continue
 
-                ns, pid, state, replica = (
-                    fields[f_indices["namespace_index"]],
-                    int(fields[f_indices["partition_index"]]),
-                    fields[f_indices["state_index"]],
-                    int(fields[f_indices["replica_index"]]),
-                )
-
-                if f_indices["working_master_index"]:
-                    working_master = fields[f_indices["working_master_index"]]
-                    origin = target = None
-                else:
-                    origin, target = (
-                        fields[f_indices["origin_index"]],
-                        fields[f_indices["target_index"]],
-                    )
-                    working_master = None
+                    seen_namespaces.append(ns)
 
-                if pid not in range(pid_range):
-                    print(
-                        "For {0} found partition-ID {1} which is beyond legal partitions(0...4096)".format(
-                            ns, pid
+                    if fields[wm_i] == node_id:
+                        # Working master
+                        master_rows.append(ns)
+                    elif int(fields[replica_i]) == 0 or fields[state_i] in ("S", "D"):
+                        # Eventual master or replicas
+                        prole_rows.append(ns)
+            else:
+                maxsplit = max(ns_i, pid_i, state_i, replica_i, origin_i, target_i) + 1
+
+                for item in items:
+                    fields = item.split(":", maxsplit)
+                    ns = fields[ns_i]
+                    pid = int(fields[pid_i])
+
+                    if pid < 0 or pid >= PID_RANGE:
+                        print(
+                            "For {0} found partition-ID {1} which is beyond legal partitions(0...4096)".format(
+                                ns, pid
+                            )
                         )
-                    )
-                    continue
+                        continue
+
+                    seen_namespaces.append(ns)
+
+                    if int(fields[replica_i]) == 0:
+                        if fields[origin_i] == "0":
+                            # Working master (Final and proper master)
+                            master_rows.append(ns)
+                        else:
+                            # Eventual master
+                            prole_rows.append(ns)
+                    elif fields[target_i] == "0":
+                        if fields[state_i] in ("S", "D"):
+                            prole_rows.append(ns)
+                    else:
+                        # Working master (Acting master)
+                        master_rows.append(ns)
 
-                if ns not in node_pmap:
-                    node_pmap[ns] = {
-                        "master_partition_count": 0,
-                        "prole_partition_count": 0,
-                    }
+            master_counts = Counter(master_rows)
+            prole_counts = Counter(prole_rows)
+
+            # dict.fromkeys dedupes while keeping first-seen order, so the
+            # materialization loop runs once per namespace, not per row.
+            for ns in dict.fromkeys(seen_namespaces):
+                node_pmap[ns] = {
+                    "master_partition_count": master_counts[ns],
+                    "prole_partition_count": prole_counts[ns],
+                }
 
                 if ck not in ns_available_part:
                     ns_available_part[ck] = {}
@@ -978,50 +1153,12 @@ class GetPmapController:
                     ns_available_part[ck][ns] = {}
                     ns_available_part[ck][ns]["available_partition_count"] = 0
 
-                if working_master:
-                    if node_id == working_master:
-                        # Working master
-                        node_pmap[ns]["master_partition_count"] += 1
-
-                    elif replica == 0 or state == "S" or state == "D":
-                        # Eventual master or replicas
-                        node_pmap[ns]["prole_partition_count"] += 1
-
-                elif replica == 0:
-                    if origin == "0":
-                        # Working master (Final and proper master)
-                        node_pmap[ns]["master_partition_count"] += 1
-
-                    else:
-                        # Eventual master
-                        node_pmap[ns]["prole_partition_count"] += 1
-
-                else:
-                    if target == "0":
-                        if state == "S" or state == "D":
-                            node_pmap[ns]["prole_partition_count"] += 1
-
-                    else:
-                        # Working master (Acting master)
-                        node_pmap[ns]["master_partition_count"] += 1
-
             pmap_data[_node] = node_pmap
 
-        for _node, _ns_data in pmap_data.items():
-            ck = cluster_keys[_node]
-
-            for ns, params in _ns_data.items():
-                params["cluster_key"] = ck
-
-                try:
-                    params.update(ns_info[ck][ns][_node])
-                except Exception:
-                    pass
-
         return pmap_data
 
     async def get_pmap(self, nodes="all"):
-        getter = GetStatisticsController(self.cluster)
+        getter = self._stats_getter
         service_stats = asyncio.create_task(getter.get_service(nodes=nodes))
         namespace_stats = asyncio.create_task(
             getter.get_namespace(flip=True, nodes=nodes)
@@ -1041,10 +1178,12 @@ class GetPmapController:
                     service_stats[node], ("cluster_key"), default_value="N/E"
                 )
 
+        # Parse the partition map as soon as its RPC lands; the namespace
+        # stats RPC keeps streaming in while this CPU-bound pass runs and is
+        # only awaited for the final merge.
+        pmap_data = self._get_pmap_data(await pmap_info, cluster_keys, await node_ids)
         ns_info = self._get_namespace_data(await namespace_stats, cluster_keys)
-        pmap_data = self._get_pmap_data(
-            await pmap_info, ns_info, cluster_keys, await node_ids
-        )
+        self._merge_namespace_data(pmap_data, ns_info, cluster_keys)
 
         return pmap_data
 
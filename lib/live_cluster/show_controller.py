@@ -271,13 +271,17 @@ class ShowLatenciesController(LiveClusterCommandController):
             line=line, arg="-v", default=False, modifiers=self.modifiers, mods=self.mods
         )
 
-        namespace_set = await self._get_namespace_set()
-        latencies, (latencies_nodes, latency_nodes) = await asyncio.gather(
-            self.latency_getter.get_all(
-                self.nodes, buckets, increment, verbose, namespace_set
-            ),
+        # The namespace-set and build-classification RPCs are independent;
+        # run them in one wave, then reuse the classification in get_all so
+        # info_build is only fetched once.
+        namespace_set, nodes_split = await asyncio.gather(
+            self._get_namespace_set(),
             self.latency_getter.get_latencies_and_latency_nodes(self.nodes),
         )
+        latencies_nodes, latency_nodes = nodes_split
+        latencies = await self.latency_getter.get_all(
+            self.nodes, buckets, increment, verbose, namespace_set, nodes_split
+        )
 
         # No nodes support "show latencies"
         if len(latencies_nodes) == 0:
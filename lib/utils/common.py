@@ -20,6 +20,7 @@ import asyncio
 import datetime
 import json
 import logging
+import functools
 import operator
 import os
 import platform
@@ -2374,12 +2375,16 @@ def is_new_histogram_version(version_):
 
 
 ########## Latencies ##########
+@functools.lru_cache(maxsize=32)
 def is_new_latencies_version(version_):
     """
     Function takes a version to check
 
     It returns true if the version is supporting the new latencies command else
      returns false
+
+    Cached by build string since a cluster has few distinct builds but the
+    check runs once per node.
     """
 
     if not version_:
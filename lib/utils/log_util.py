@@ -91,12 +91,26 @@ def get_all_files(dir_path=""):
     fname_list = []
     if not dir_path:
         return fname_list
-    try:
-        for root, sub_dir, files in os.walk(dir_path):
-            for fname in files:
-                fname_list.append(os.path.join(root, fname))
-    except Exception:
-        pass
+
+    # os.scandir-based walk; DirEntry.is_dir() uses the cached d_type and
+    # avoids the stat() per entry that os.walk used to do.
+    pending = [dir_path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif not entry.is_dir():
+                            # symlinked dirs are neither walked nor listed,
+                            # matching os.walk(followlinks=False)
+                            fname_list.append(entry.path)
+                    except OSError:
+                        pass
+        except Exception:
+            pass
 
     return fname_list
 
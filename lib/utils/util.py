@@ -113,16 +113,23 @@ def capture_stderr(func, *args, **kwargs):
     return output
 
 
-def compile_likes(likes):
-    if likes is None:
-        likes = []
-
+@functools.lru_cache(maxsize=256)
+def _compile_likes(likes: tuple):
     likes = ["(" + like.translate(str.maketrans("", "", "'\"")) + ")" for like in likes]
     likes = "|".join(likes)
     likes = re.compile(likes)
     return likes
 
 
+def compile_likes(likes):
+    # The same patterns are recompiled for every host/namespace in the getter
+    # loops; memoize on the (hashable) pattern tuple.
+    if likes is None:
+        likes = ()
+
+    return _compile_likes(tuple(likes))
+
+
 def filter_list(
     ilist: Iterable[str], pattern_list: Iterable[str] | None
 ) -> Iterable[str] | filter:
@@ -386,10 +393,10 @@ def flip_keys(orig_data):
             continue
 
         for key2, data2 in data1.items():
-            if key2 not in new_data:
-                new_data[key2] = {}
-
-            new_data[key2][key1] = data2
+            try:
+                new_data[key2][key1] = data2
+            except KeyError:
+                new_data[key2] = {key1: data2}
 
     return new_data
 
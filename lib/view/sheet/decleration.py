@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from collections import Counter
-from functools import reduce
+from functools import lru_cache, reduce
 import logging
+import math
 from operator import itemgetter
 from typing import Any, Callable, Generic, Optional, TypeVar, Union
 
@@ -38,11 +39,15 @@ class ErrorEntryException(Exception):
 
 
 class EntryValue:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
 
 class EntryData(EntryValue):
+    __slots__ = ("values", "record", "common", "is_error", "is_no_entry")
+
     def __init__(
         self,
         value: Any,
@@ -73,12 +78,26 @@ ConverterType = Callable[[EntryData], Any]
 
 class Converters:
     @staticmethod
-    def _file_size(value, unit):
+    @lru_cache(maxsize=4096)
+    def _file_size_cached(value, unit):
         try:
             return file_size.size(value, unit)
         except Exception:
             return value
 
+    @staticmethod
+    def _file_size(value, unit):
+        # Cells repeat values heavily (zeros, shared counters); format each
+        # distinct (value, unit) once per render instead of once per cell.
+        # Unhashable values (e.g. lists) fall through uncached.
+        try:
+            return Converters._file_size_cached(value, unit)
+        except TypeError:
+            try:
+                return file_size.size(value, unit)
+            except Exception:
+                return value
+
     @staticmethod
     def byte(edata: EntryValue):
         """
@@ -257,6 +276,8 @@ AggregatorFunc = Callable[..., Any]
 
 
 class Aggregator(object):
+    __slots__ = ("func", "converter")
+
     def __init__(
         self, aggregate_func: AggregatorFunc, converter: Optional[ConverterType] = None
     ):
@@ -281,6 +302,8 @@ ReduceAggregatorFunc = Callable[[Any, Any], ReduceAggregatorReturnType]
 
 
 class ReduceAggregator(Aggregator, Generic[ReduceAggregatorReturnType]):
+    __slots__ = ("initializer",)
+
     def __init__(
         self,
         aggregate_func: ReduceAggregatorFunc,
@@ -325,7 +348,40 @@ class ReduceAggregator(Aggregator, Generic[ReduceAggregatorReturnType]):
         return result
 
 
+class SumAggregator(ReduceAggregator):
+    """Sums the whole column in one C-level pass instead of reducing
+    element by element; fsum keeps float columns accurate while int
+    columns stay ints through builtin sum.
+    """
+
+    __slots__ = ()
+
+    def _reduce(self, edatas: list[EntryValue]):
+        if self.initializer is None:
+            return None
+
+        values = []
+
+        for edata in edatas:
+            value = edata.value
+
+            if value is None:
+                return None
+
+            values.append(value)
+
+        if not values:
+            return None
+
+        if any(isinstance(value, float) for value in values):
+            return math.fsum(values) + self.initializer
+
+        return sum(values, self.initializer)
+
+
 class ComplexAggregator(Aggregator):
+    __slots__ = ()
+
     def __init__(
         self,
         aggregate_func: Callable[[list[EntryData]], Any],
@@ -353,7 +409,7 @@ AggregatorCreatorType = Callable[
 class Aggregators(object):
     @staticmethod
     def sum(initializer=0, converter=None):
-        return ReduceAggregator(
+        return SumAggregator(
             lambda acc, value: acc + value,
             initializer=initializer,
             converter=converter,
@@ -385,6 +441,8 @@ class Aggregators(object):
 
 
 class Projector(object):
+    __slots__ = ("field_type",)
+
     def __init__(self, field_type: str):
         """
         Arguments:
@@ -415,6 +473,8 @@ class Projector(object):
 
 
 class SimpleProjector(Projector):
+    __slots__ = ("source", "keys", "for_each_key")
+
     def __init__(self, field_type: str, source: str, *keys, **kwargs):
         """
         Arguments:
@@ -475,13 +535,15 @@ class SimpleProjector(Projector):
             return row[self.keys[0]]
         else:
             # Setting 'self.keys' to one or more strings indicates that the
-            # field needs to be accessed by key.
-            try:
-                return next(row[k] for k in self.keys if k in row)
-            except (KeyError, StopIteration):
-                raise NoEntryException(
-                    "{} does not contain any key in {}".format(self.source, self.keys)
-                )
+            # field needs to be accessed by key. A plain loop here skips the
+            # generator frame the old next(...) form paid per row.
+            for k in self.keys:
+                if k in row:
+                    return row[k]
+
+            raise NoEntryException(
+                "{} does not contain any key in {}".format(self.source, self.keys)
+            )
 
     def get_sources(self) -> set[str]:
         return set([self.source])
@@ -489,6 +551,8 @@ class SimpleProjector(Projector):
 
 class Projectors(object):
     class Identity(SimpleProjector):
+        __slots__ = ()
+
         def __init__(self, source: str, *keys, **kwargs):
             super().__init__(FieldType.undefined, source, *keys, **kwargs)
 
@@ -501,10 +565,14 @@ class Projectors(object):
             return row
 
     class String(SimpleProjector):
+        __slots__ = ()
+
         def __init__(self, source: str, *keys, **kwargs):
             super().__init__(FieldType.string, source, *keys, **kwargs)
 
     class Boolean(SimpleProjector):
+        __slots__ = ()
+
         def __init__(self, source: str, *keys, **kwargs):
             super().__init__(FieldType.boolean, source, *keys, **kwargs)
 
@@ -517,6 +585,8 @@ class Projectors(object):
             return True if value else False
 
     class Float(SimpleProjector):
+        __slots__ = ()
+
         def __init__(self, source: str, *keys, **kwargs):
             super().__init__(FieldType.number, source, *keys, **kwargs)
 
@@ -529,6 +599,8 @@ class Projectors(object):
                 return value
 
     class Number(SimpleProjector):
+        __slots__ = ()
+
         def __init__(self, source: str, *keys, **kwargs):
             super().__init__(FieldType.number, source, *keys, **kwargs)
 
@@ -546,6 +618,8 @@ class Projectors(object):
                 return value
 
     class Percent(Number):
+        __slots__ = ("invert",)
+
         def __init__(self, source, *keys, **kwargs):
             """
             Keyword Arguments:
@@ -559,6 +633,8 @@ class Projectors(object):
             return value if not self.invert else 100 - value
 
     class Exception(SimpleProjector):
+        __slots__ = ("filter_exc",)
+
         def __init__(self, source, *keys, **kwargs):
             """
             Keyword Arguments:
@@ -579,6 +655,8 @@ class Projectors(object):
             return row
 
     class Sum(Projector):
+        __slots__ = ("field_projectors",)
+
         def __init__(self, *field_projectors: Projector):
             """
             Arguments:
@@ -604,6 +682,8 @@ class Projectors(object):
             return reduce(lambda acc, elem: acc.union(elem), sources, set())
 
     class Div(Projector):
+        __slots__ = ("numerator_projector", "denominator_projector")
+
         def __init__(self, numerator_projector, denominator_projector):
             """
             Arguments:
@@ -641,6 +721,8 @@ class Projectors(object):
             return reduce(lambda acc, elem: acc.union(elem), sources, set())
 
     class Any(Projector):
+        __slots__ = ("field_projectors",)
+
         def __init__(self, field_type: str, *field_projectors: Projector):
             """
             Arguments:
@@ -664,6 +746,8 @@ class Projectors(object):
             return reduce(lambda acc, elem: acc.union(elem), sources, set())
 
     class Func(Projector):
+        __slots__ = ("func", "field_projectors")
+
         def __init__(self, field_type: str, func, *field_projectors: Projector):
             """
             Arguments:
@@ -692,6 +776,22 @@ class Projectors(object):
 
 
 class Field(object):
+    __slots__ = (
+        "title",
+        "projector",
+        "converter",
+        "formatters",
+        "aggregator",
+        "align",
+        "key",
+        "hidden",
+        "dynamic_field_decl",
+        "allow_diff",
+        "has_aggregate",
+        "title_words",
+        "min_title_width",
+    )
+
     def __init__(
         self,
         title: str,
@@ -753,6 +853,8 @@ class Field(object):
 
 
 class TitleField(Field):
+    __slots__ = ()
+
     def __init__(
         self,
         title,
@@ -778,6 +880,8 @@ class TitleField(Field):
 
 
 class Subgroup(object):
+    __slots__ = ("title", "fields", "key", "has_aggregate")
+
     def __init__(
         self, title: str, fields: tuple[Field, ...], key: Optional[str] = None
     ):
@@ -840,6 +944,8 @@ class DynamicFields(object):
 
 
 class FieldSorter:
+    __slots__ = ("field_name", "reverse")
+
     def __init__(self, field_name: str, reverse: bool = False) -> None:
         self.field_name = field_name
         self.reverse = reverse
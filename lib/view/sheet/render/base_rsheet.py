@@ -401,10 +401,9 @@ class BaseRSheet(object):
     def where(self, projections):
         if self.decleration.where:
             where_fn = self.decleration.where
-
-            for record_ix in range(len(projections) - 1, -1, -1):
-                if not where_fn(projections[record_ix]):
-                    del projections[record_ix]
+            # Rebuild in one pass; deleting mid-list shifts the tail per
+            # dropped record, which is quadratic when most rows filter out.
+            projections = [record for record in projections if where_fn(record)]
 
         return projections
 
@@ -14,6 +14,7 @@
 
 from datetime import datetime
 import itertools
+import operator
 from typing import Iterable, Literal, Union
 from lib.live_cluster.client.types import ASInfoError
 from lib.view.sheet.decleration import (
@@ -45,13 +46,15 @@ from lib.view.sheet import (
 
 
 def project_build(b, v):
-    if "community" in v.lower():
+    v = v.lower()
+
+    if "community" in v:
         return "C-" + b
 
-    if "enterprise" in v.lower():
+    if "enterprise" in v:
         return "E-" + b
 
-    if "federal" in v.lower():
+    if "federal" in v:
         return "F-" + b
 
     return b
@@ -94,6 +97,15 @@ def _ignore_null(s: str):
 #
 
 
+try:
+    # Python 3.12+: dot product in one C loop.
+    from math import sumprod as _sumprod
+except ImportError:
+
+    def _sumprod(values, weights):
+        return sum(map(operator.mul, values, weights))
+
+
 def weighted_avg(values: Iterable[float], weights: Iterable[float]):
     """
     Computes the average of multiple percentage points. Remember: used/total = percent or percent * total = used
@@ -101,18 +113,15 @@ def weighted_avg(values: Iterable[float], weights: Iterable[float]):
     the average of percents we can use sum(used for each element) / sum(total for each element) or because
     percent * total = used we can do sum(percent * total for each element) / sum(total for each element).
     """
-    weights_total = 0.0
-    values_total = 0.0
-
-    for v, w in zip(values, weights):
-        weighted_value = v * w
-        values_total += weighted_value
-        weights_total += w
+    # Materialize weights once; values may stay lazy since _sumprod stops at
+    # the shorter input just as the old zip loop did.
+    weights = list(weights)
+    weights_total = sum(weights)
 
     if not weights_total:
         return 0.0
 
-    return values_total / weights_total
+    return _sumprod(values, weights) / weights_total
 
 
 #
@@ -234,9 +243,20 @@ info_network_sheet = Sheet(
 
 def create_usage_weighted_avg(type: str):
     def usage_weighted_avg(edatas: list[EntryData]):
-        pcts: map[float] = map(lambda edata: edata.value, edatas)
-        weights: map[float] = map(lambda edata: edata.record[type]["Total"], edatas)
-        return weighted_avg(pcts, weights)
+        # Single fused pass; the map/zip pairing cost three Python-level
+        # calls per row and walked edata.record twice.
+        values_total = 0.0
+        weights_total = 0.0
+
+        for edata in edatas:
+            weight = edata.record[type]["Total"]
+            values_total += edata.value * weight
+            weights_total += weight
+
+        if not weights_total:
+            return 0.0
+
+        return values_total / weights_total
 
     return usage_weighted_avg
 